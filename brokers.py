@@ -1,34 +1,62 @@
 import os
 import httpx
+import random
 import asyncio
-import pyotp
-import robin_stocks.robinhood as rh
-from bbae_invest_api import BBAEAPI
-from dspac_invest_api import DSPACAPI
-from firstrade import account as ft_account, order, symbols
-from public_invest_api import Public
-from fennel_invest_api import Fennel
 from decimal import Decimal
-from tastytrade import Session, Account
-from tastytrade.instruments import Equity
-from tastytrade.order import (
-    NewOrder,
-    OrderTimeInForce,
-    OrderType,
-    PriceEffect,
-    OrderAction,
-)
-from schwab import auth
-from schwab.orders.equities import (
-    equity_buy_limit,
-    equity_buy_market,
-    equity_sell_limit,
-    equity_sell_market,
-)
 from dotenv import load_dotenv
 
 load_dotenv("./.env")
 
+# Shared connection settings for the Tradier client; keep-alive lets the
+# per-account order requests reuse a single TLS session.
+TRADIER_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60)
+TRADIER_HTTP_TIMEOUT = httpx.Timeout(15.0, connect=5.0, pool=5.0)
+TRADIER_PROFILE_URL = "https://api.tradier.com/v1/user/profile"
+TRADIER_ORDERS_URL = "https://api.tradier.com/v1/accounts/{}/orders"
+TRADIER_MAX_RETRIES = 3
+TRADIER_MAX_RETRY_DELAY = 5.0
+
+# Caps on in-flight per-account requests, to stay clear of each broker's rate limits
+ROBINHOOD_CONCURRENCY = 4
+TRADIER_CONCURRENCY = 8
+TASTY_CONCURRENCY = 4
+FENNEL_CONCURRENCY = 4
+
+# Held by a broker for its whole interactive login (2FA, captcha, email codes) so
+# only one broker reads stdin at a time and codes reach the broker that asked for them
+INTERACTIVE_LOGIN_LOCK = asyncio.Lock()
+
+
+# asyncio.gather(..., return_exceptions=True) with at most `limit` coroutines running at once
+async def _gather_bounded(limit, coros):
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=True)
+
+
+# Send a Tradier request, retrying with jittered exponential backoff (or the server's
+# Retry-After) when it is throttled. Orders are only retried on 429: after a 5xx the
+# order may still have been accepted, and resubmitting it could double the position.
+# Waits never exceed TRADIER_MAX_RETRY_DELAY so an order isn't sent long after the user
+# asked for it, at a different price.
+async def _tradier_request(client, method, url, **kwargs):
+    retry_statuses = {429} if method == "POST" else {429, 500, 502, 503, 504}
+
+    for attempt in range(TRADIER_MAX_RETRIES + 1):
+        response = await client.request(method, url, **kwargs)
+        if response.status_code not in retry_statuses or attempt == TRADIER_MAX_RETRIES:
+            return response
+
+        delay = 0.25 * 2 ** attempt * random.uniform(0.5, 1.5)
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+        await asyncio.sleep(min(delay, TRADIER_MAX_RETRY_DELAY))
+
 
 async def robinTrade(side, qty, ticker, price):
     ROBINHOOD_USER = os.getenv("ROBINHOOD_USER")
@@ -39,37 +67,54 @@ async def robinTrade(side, qty, ticker, price):
         print("No Robinhood credentials supplied, skipping")
         return None
 
+    try:
+        import pyotp
+        import robin_stocks.robinhood as rh
+    except ImportError:
+        print("Robinhood client library not installed, skipping")
+        return None
+
     mfa = pyotp.TOTP(ROBINHOOD_MFA).now()
-    await asyncio.to_thread(rh.login, ROBINHOOD_USER, ROBINHOOD_PASS, mfa_code=mfa)
+    # robin_stocks prompts on stdin itself for challenge codes and rejected MFA codes
+    async with INTERACTIVE_LOGIN_LOCK:
+        await asyncio.to_thread(rh.login, ROBINHOOD_USER, ROBINHOOD_PASS, mfa_code=mfa)
 
     all_accounts = await asyncio.to_thread(rh.account.load_account_profile, dataType="results")
+    if not all_accounts:
+        print("No Robinhood accounts found, skipping")
+        return None
 
-    for account in all_accounts:
+    if side == 'buy':
+        order_function = rh.order_buy_limit if price else rh.order_buy_market
+    elif side == 'sell':
+        order_function = rh.order_sell_limit if price else rh.order_sell_market
+    else:
+        print(f"Invalid side: {side}")
+        return None
+
+    base_order_args = {
+        "symbol": ticker,
+        "quantity": qty,
+        "timeInForce": "gfd",
+    }
+    if price:
+        base_order_args['limitPrice'] = price
+    action_str = "Bought" if side == "buy" else "Sold"
+
+    async def place_order(account):
         account_number = account['account_number']
         brokerage_account_type = account['brokerage_account_type']
 
-        if side == 'buy':
-            order_function = rh.order_buy_limit if price else rh.order_buy_market
-        elif side == 'sell':
-            order_function = rh.order_sell_limit if price else rh.order_sell_market
-        else:
-            print(f"Invalid side: {side}")
-            return None
-
-        order_args = {
-            "symbol": ticker,
-            "quantity": qty,
-            "account_number": account_number,
-            "timeInForce": "gfd",
-        }
-        if price:
-            order_args['limitPrice'] = price
+        await asyncio.to_thread(order_function, account_number=account_number, **base_order_args)
 
-        await asyncio.to_thread(order_function, **order_args)
-        action_str = "Bought" if side == "buy" else "Sold"
-        
         print(f"{action_str} {ticker} on Robinhood {brokerage_account_type} account {account_number}")
 
+    # Accounts are independent, so submit every order at once rather than one round-trip at a time
+    results = await _gather_bounded(ROBINHOOD_CONCURRENCY, (place_order(account) for account in all_accounts))
+    for account, result in zip(all_accounts, results):
+        if isinstance(result, Exception):
+            print(f"Failed to place order for {ticker} on Robinhood account {account['account_number']}: {result}")
+
 
 async def tradierTrade(side, qty, ticker, price):
     TRADIER_ACCESS_TOKEN = os.getenv("TRADIER_ACCESS_TOKEN")
@@ -78,21 +123,25 @@ async def tradierTrade(side, qty, ticker, price):
         print("Missing Tradier credentials, skipping")
         return None
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            "https://api.tradier.com/v1/user/profile",
-            headers={
-                "Authorization": f"Bearer {TRADIER_ACCESS_TOKEN}",
-                "Accept": "application/json",
-            },
-        )
+    # Transport-level retries only cover failed connection attempts, where nothing
+    # reached Tradier, so they are safe for order POSTs as well
+    transport = httpx.AsyncHTTPTransport(http2=True, limits=TRADIER_HTTP_LIMITS, retries=2)
+    headers = {
+        "Authorization": f"Bearer {TRADIER_ACCESS_TOKEN}",
+        "Accept": "application/json",
+    }
+    async with httpx.AsyncClient(transport=transport, timeout=TRADIER_HTTP_TIMEOUT, headers=headers) as client:
+        response = await _tradier_request(client, "GET", TRADIER_PROFILE_URL)
 
         if response.status_code != 200:
-            print(f"Error: {response.status} - {await response.text()}")
+            print(f"Error: {response.status_code} - {response.text}")
             return False
 
         profile_data = response.json()
         accounts = profile_data.get("profile", {}).get("account", [])
+        # Tradier returns a bare object instead of a list when there is only one account
+        if isinstance(accounts, dict):
+            accounts = [accounts]
         if not accounts:
             print("No accounts found.")
             return False
@@ -102,31 +151,33 @@ async def tradierTrade(side, qty, ticker, price):
         # Order placement
         order_type = "limit" if price else "market"
         price_data = {"price": f"{price}"} if price else {}
+        order_data = {
+            "class": "equity",
+            "symbol": ticker,
+            "side": side,
+            "quantity": qty,
+            "type": order_type,
+            "duration": "day",
+            **price_data,
+        }
+        action_str = "Bought" if side == "buy" else "Sold"
 
-        for account_id in TRADIER_ACCOUNT_ID:
-            response = await client.post(
-                f"https://api.tradier.com/v1/accounts/{account_id}/orders",
-                data={
-                    "class": "equity",
-                    "symbol": ticker,
-                    "side": side,
-                    "quantity": qty,
-                    "type": order_type,
-                    "duration": "day",
-                    **price_data,
-                },
-                headers={
-                    "Authorization": f"Bearer {TRADIER_ACCESS_TOKEN}",
-                    "Accept": "application/json",
-                },
-            )
+        responses = await _gather_bounded(
+            TRADIER_CONCURRENCY,
+            (
+                _tradier_request(client, "POST", TRADIER_ORDERS_URL.format(account_id), data=order_data)
+                for account_id in TRADIER_ACCOUNT_ID
+            ),
+        )
 
-            if response.status_code != 200:
+        for account_id, response in zip(TRADIER_ACCOUNT_ID, responses):
+            if isinstance(response, Exception):
+                print(f"Error placing order on account {account_id}: {response}")
+            elif response.status_code != 200:
                 print(
-                    f"Error placing order on account {account_id}: {await response.text()}"
+                    f"Error placing order on account {account_id}: {response.text}"
                 )
             else:
-                action_str = "Bought" if side == "buy" else "Sold"
                 print(f"{action_str} {ticker} on Tradier account {account_id}")
 
 
@@ -134,13 +185,29 @@ async def tastyTrade(side, qty, ticker, price):
     TASTY_USER = os.getenv("TASTY_USER")
     TASTY_PASS = os.getenv("TASTY_PASS")
 
-    if not (TASTY_USER or TASTY_PASS):
+    if not (TASTY_USER and TASTY_PASS):
         print("No TastyTrade credentials supplied, skipping")
         return None
 
-    session = Session(TASTY_USER, TASTY_PASS)
-    accounts = Account.get_accounts(session)
-    symbol = Equity.get_equity(session, ticker)
+    try:
+        from tastytrade import Session, Account
+        from tastytrade.instruments import Equity
+        from tastytrade.order import (
+            NewOrder,
+            OrderTimeInForce,
+            OrderType,
+            PriceEffect,
+            OrderAction,
+        )
+    except ImportError:
+        print("TastyTrade client library not installed, skipping")
+        return None
+
+    session = await asyncio.to_thread(Session, TASTY_USER, TASTY_PASS)
+    accounts, symbol = await asyncio.gather(
+        asyncio.to_thread(Account.get_accounts, session),
+        asyncio.to_thread(Equity.get_equity, session, ticker),
+    )
     action = OrderAction.BUY_TO_OPEN if side == "buy" else OrderAction.SELL_TO_CLOSE
 
     # Build the order
@@ -154,16 +221,25 @@ async def tastyTrade(side, qty, ticker, price):
         "price_effect": price_effect,
     }
     if price:
-        order_args["price"] = price
+        # Go through str so the float's binary representation doesn't leak into the Decimal
+        order_args["price"] = Decimal(str(price))
     
     order = NewOrder(**order_args)
+    action_str = "Bought" if side == "buy" else "Sold"
+
+    results = await _gather_bounded(
+        TASTY_CONCURRENCY,
+        (asyncio.to_thread(acc.place_order, session, order, dry_run = False) for acc in accounts),
+    )
+
+    for acc, placed_order in zip(accounts, results):
+        if isinstance(placed_order, Exception):
+            print(f"Failed to place order for {ticker} on TastyTrade account {acc.account_number}: {placed_order}")
+            continue
 
-    for acc in accounts:
-        placed_order = acc.place_order(session, order, dry_run = False)
         order_status = placed_order.order.status.value
 
         if order_status in ["Received", "Routed"]:
-            action_str = "Bought" if side == "buy" else "Sold"
             print(f"{action_str} {ticker} on TastyTrade {acc.account_type_name} account {acc.account_number}")
 
 async def publicTrade(side, qty, ticker, price):
@@ -174,8 +250,15 @@ async def publicTrade(side, qty, ticker, price):
         print("No Public credentials supplied, skipping")
         return None
 
+    try:
+        from public_invest_api import Public
+    except ImportError:
+        print("Public client library not installed, skipping")
+        return None
+
     public = Public(path="./tokens/")
-    await asyncio.to_thread(public.login, username=PUBLIC_USER, password=PUBLIC_PASS, wait_for_2fa=True)
+    async with INTERACTIVE_LOGIN_LOCK:
+        await asyncio.to_thread(public.login, username=PUBLIC_USER, password=PUBLIC_PASS, wait_for_2fa=True)
 
     order = await asyncio.to_thread(
         public.place_order,
@@ -198,21 +281,35 @@ async def firstradeTrade(side, qty, ticker):
     FIRSTRADE_PASS = os.getenv("FIRSTRADE_PASS")
     FIRSTRADE_PIN = os.getenv("FIRSTRADE_PIN")
 
+    if not (FIRSTRADE_USER and FIRSTRADE_PASS and FIRSTRADE_PIN):
+        print("No Firstrade credentials supplied, skipping")
+        return None
+
+    try:
+        from firstrade import account as ft_account, order, symbols
+    except ImportError:
+        print("Firstrade client library not installed, skipping")
+        return None
+
     ft_ss = ft_account.FTSession(
         username=FIRSTRADE_USER, 
         password=FIRSTRADE_PASS,
         pin=FIRSTRADE_PIN,
         profile_path="./tokens/"
     )
-    need_code = ft_ss.login()
+    need_code = await asyncio.to_thread(ft_ss.login)
     if need_code:
-        code = input("Please enter the pin sent to your email/phone: ")
-        ft_ss.login_two(code)
+        async with INTERACTIVE_LOGIN_LOCK:
+            code = await asyncio.to_thread(input, "Please enter the pin sent to your email/phone: ")
+            await asyncio.to_thread(ft_ss.login_two, code)
+
+    ft_accounts = await asyncio.to_thread(ft_account.FTAccountData, ft_ss)
+    if not ft_accounts.account_numbers:
+        print("No Firstrade accounts found, skipping")
+        return None
 
-    ft_accounts = ft_account.FTAccountData(ft_ss)
-    
     # Firstrade does not allow market orders for stocks under $1.00
-    symbol_data = symbols.SymbolQuote(ft_ss, ft_accounts.account_numbers[0], ticker)
+    symbol_data = await asyncio.to_thread(symbols.SymbolQuote, ft_ss, ft_accounts.account_numbers[0], ticker)
     if symbol_data.last < 1.00:
         price_type = order.PriceType.LIMIT
         if side == "buy":
@@ -224,29 +321,42 @@ async def firstradeTrade(side, qty, ticker):
         price = None
 
     ft_order = order.Order(ft_ss)
+    order_type = order.OrderType.BUY if side == "buy" else order.OrderType.SELL
+
+    # All accounts go through one Order object, so submit them from a single worker
+    # thread instead of paying a thread-pool hop per account
+    results = await asyncio.to_thread(
+        _firstrade_place_orders,
+        ft_order,
+        ft_accounts.account_numbers,
+        symbol=ticker,
+        price_type=price_type,
+        order_type=order_type,
+        quantity=qty,
+        duration=order.Duration.DAY,
+        price=price,
+        dry_run=False,
+    )
 
-    for account_number in ft_accounts.account_numbers:
-        try:
-            order_conf = await asyncio.to_thread(
-                ft_order.place_order,
-                account_number,
-                symbol=ticker,
-                price_type=price_type,
-                order_type=order.OrderType.BUY if side == "buy" else order.OrderType.SELL,
-                quantity=qty,
-                duration=order.Duration.DAY,
-                price=price,
-                dry_run=False,
-            )
+    for account_number, order_conf in results:
+        if isinstance(order_conf, Exception):
+            print(f"An error occurred while placing order for {ticker} on Firstrade: {order_conf}")
+        elif order_conf.get("message") == "Normal":
+            print(f"Order for {ticker} placed on Firstrade successfully.")
+            print(f"Order ID: {order_conf.get('result').get('order_id')}.")
+        else:
+            print(f"Failed to place order for {ticker} on Firstrade.")
+            print(order_conf)
 
-            if order_conf.get("message") == "Normal":
-                print(f"Order for {ticker} placed on Firstrade successfully.")
-                print(f"Order ID: {order_conf.get("result").get('order_id')}.")
-            else:
-                print(f"Failed to place order for {ticker} on Firstrade.")
-                print(order_conf)
+
+def _firstrade_place_orders(ft_order, account_numbers, **order_args):
+    results = []
+    for account_number in account_numbers:
+        try:
+            results.append((account_number, ft_order.place_order(account_number, **order_args)))
         except Exception as e:
-            print(f"An error occurred while placing order for {ticker} on Firstrade: {e}")
+            results.append((account_number, e))
+    return results
 
 
 async def fennelTrade(side, qty, ticker, price):
@@ -256,22 +366,40 @@ async def fennelTrade(side, qty, ticker, price):
         print("No Fennel credentials supplied, skipping")
         return None
 
+    try:
+        from fennel_invest_api import Fennel
+    except ImportError:
+        print("Fennel client library not installed, skipping")
+        return None
+
     fennel = Fennel(path="./tokens/")
-    await asyncio.to_thread(fennel.login, email=FENNEL_EMAIL, wait_for_code=True)
+    async with INTERACTIVE_LOGIN_LOCK:
+        await asyncio.to_thread(fennel.login, email=FENNEL_EMAIL, wait_for_code=True)
 
     account_ids = await asyncio.to_thread(fennel.get_account_ids)
-    for account_id in account_ids:
-        order = await asyncio.to_thread(
-            fennel.place_order,
-            account_id=account_id,
-            ticker=ticker,
-            quantity=qty,
-            side=side,
-            price="market",
-        )
+    action_str = "Bought" if side == "buy" else "Sold"
+
+    # place_order takes the account id per call, so the orders don't share any
+    # client-side account state and can be submitted together
+    results = await _gather_bounded(
+        FENNEL_CONCURRENCY,
+        (
+            asyncio.to_thread(
+                fennel.place_order,
+                account_id=account_id,
+                ticker=ticker,
+                quantity=qty,
+                side=side,
+                price="market",
+            )
+            for account_id in account_ids
+        ),
+    )
 
-        if order.get('data', {}).get('createOrder') == 'pending':
-            action_str = "Bought" if side == "buy" else "Sold"
+    for account_id, order in zip(account_ids, results):
+        if isinstance(order, Exception):
+            print(f"Failed to place order for {ticker} on Fennel account {account_id}: {order}")
+        elif order.get('data', {}).get('createOrder') == 'pending':
             print(f"{action_str} {ticker} on Fennel account {account_id}")
         else:
             print(f"Failed to place order for {ticker} on Fennel account {account_id}")
@@ -283,7 +411,24 @@ async def schwabTrade(side, qty, ticker, price):
     SCHWAB_CALLBACK_URL = os.getenv("SCHWAB_CALLBACK_URL")
     SCHWAB_TOKEN_PATH = os.getenv("SCHWAB_TOKEN_PATH")
 
-    c = auth.easy_client(
+    if not (SCHWAB_API_KEY and SCHWAB_API_SECRET and SCHWAB_CALLBACK_URL and SCHWAB_TOKEN_PATH):
+        print("No Schwab credentials supplied, skipping")
+        return None
+
+    try:
+        from schwab import auth
+        from schwab.orders.equities import (
+            equity_buy_limit,
+            equity_buy_market,
+            equity_sell_limit,
+            equity_sell_market,
+        )
+    except ImportError:
+        print("Schwab client library not installed, skipping")
+        return None
+
+    c = await asyncio.to_thread(
+        auth.easy_client,
         SCHWAB_API_KEY,
         SCHWAB_API_SECRET,
         SCHWAB_CALLBACK_URL,
@@ -291,7 +436,7 @@ async def schwabTrade(side, qty, ticker, price):
         interactive=False
     )
 
-    accounts = c.get_account_numbers()
+    accounts = await asyncio.to_thread(_schwab_get_accounts, c)
 
     order_types = {
         ("buy", True): equity_buy_limit,
@@ -304,21 +449,30 @@ async def schwabTrade(side, qty, ticker, price):
     if not order_function:
         raise ValueError(f"Invalid combination of side: {side} and price: {price}")
 
-    for account in accounts.json():
+    # The same order spec is sent to every account
+    order_spec = order_function(ticker, qty, price) if price else order_function(ticker, qty)
+
+    for account in accounts:
         account_hash = account["hashValue"]
-        order = c.place_order(
-            account_hash,
-            (
-                order_function(ticker, qty, price)
-                if price
-                else order_function(ticker, qty)
-            ),
-        )
+        status_code, error = await asyncio.to_thread(_schwab_place_order, c, account_hash, order_spec)
 
-        if order.status_code == 201:
+        if status_code == 201:
             print(f"Order placed for {qty} shares of {ticker} on Schwab account {account['accountNumber']}")
         else:
-            print(f"Error placing order on Schwab account {account['accountNumber']}: {order.json()}")
+            print(f"Error placing order on Schwab account {account['accountNumber']}: {error}")
+
+
+# schwab-py's client is synchronous; these run in a worker thread and hand back
+# already-decoded data so no response parsing happens on the event loop
+def _schwab_get_accounts(c):
+    return c.get_account_numbers().json()
+
+
+def _schwab_place_order(c, account_hash, order_spec):
+    response = c.place_order(account_hash, order_spec)
+    if response.status_code == 201:
+        return response.status_code, None
+    return response.status_code, response.json()
 
 
 async def bbaeTrade(side, qty, ticker, price=None):
@@ -329,32 +483,48 @@ async def bbaeTrade(side, qty, ticker, price=None):
         print("No BBAE credentials supplied, skipping")
         return None
 
+    try:
+        from bbae_invest_api import BBAEAPI
+    except ImportError:
+        print("BBAE client library not installed, skipping")
+        return None
+
     bbae = BBAEAPI(BBAE_USER, BBAE_PASS, creds_path="./tokens/")
 
     await asyncio.to_thread(bbae.make_initial_request)
     login_ticket = await asyncio.to_thread(bbae.generate_login_ticket_email)
     if login_ticket.get("Data") is None:
-        raise Exception("Invalid response from generating login ticket")
+        print("Invalid response from generating BBAE login ticket, skipping")
+        return None
     if login_ticket.get("Data").get("needSmsVerifyCode", False):
-        if login_ticket.get("Data").get("needCaptchaCode", False):
-            captcha_image = bbae.request_captcha()
-            captcha_image.save("./BBAEcaptcha.png", format="PNG")
-            captcha_input = input(
-                "CAPTCHA image saved to ./BBAEcaptcha.png. Please open it and type in the code: "
-            )
-            bbae.request_email_code(captcha_input=captcha_input)
-            otp_code = input("Enter BBAE security code: ")
-        else:
-            bbae.request_email_code()
-            otp_code = input("Enter BBAE security code: ")
-        
-        login_ticket = await asyncio.to_thread(bbae.generate_login_ticket_email, otp_code)        
+        async with INTERACTIVE_LOGIN_LOCK:
+            if login_ticket.get("Data").get("needCaptchaCode", False):
+                captcha_image = await asyncio.to_thread(bbae.request_captcha)
+                captcha_image.save("./BBAEcaptcha.png", format="PNG")
+                captcha_input = await asyncio.to_thread(
+                    input,
+                    "CAPTCHA image saved to ./BBAEcaptcha.png. Please open it and type in the code: ",
+                )
+                await asyncio.to_thread(bbae.request_email_code, captcha_input=captcha_input)
+                otp_code = await asyncio.to_thread(input, "Enter BBAE security code: ")
+            else:
+                await asyncio.to_thread(bbae.request_email_code)
+                otp_code = await asyncio.to_thread(input, "Enter BBAE security code: ")
+
+            login_ticket = await asyncio.to_thread(bbae.generate_login_ticket_email, otp_code)
+            if login_ticket.get("Data") is None:
+                print("Invalid response from generating BBAE login ticket with security code, skipping")
+                return None
     
     login_response = await asyncio.to_thread(bbae.login_with_ticket, login_ticket.get("Data").get("ticket"))
     if login_response.get("Outcome") != "Success":
-        raise Exception(f"Login failed. Response: {login_response}")
+        print(f"BBAE login failed, skipping. Response: {login_response}")
+        return None
 
     account_info = await asyncio.to_thread(bbae.get_account_info)
+    if account_info.get("Data") is None:
+        print("Invalid response from retrieving BBAE account info, skipping")
+        return None
     account_number = account_info.get("Data").get('accountNumber')
 
     if not account_number:
@@ -391,32 +561,48 @@ async def dspacTrade(side, qty, ticker, price=None):
         print("No DSPAC credentials supplied, skipping")
         return None
 
+    try:
+        from dspac_invest_api import DSPACAPI
+    except ImportError:
+        print("DSPAC client library not installed, skipping")
+        return None
+
     dspac = DSPACAPI(DSPAC_USER, DSPAC_PASS, creds_path="./tokens/")
 
     await asyncio.to_thread(dspac.make_initial_request)
     login_ticket = await asyncio.to_thread(dspac.generate_login_ticket_email)
     if login_ticket.get("Data") is None:
-        raise Exception("Invalid response from generating login ticket")
+        print("Invalid response from generating DSPAC login ticket, skipping")
+        return None
     if login_ticket.get("Data").get("needSmsVerifyCode", False):
-        if login_ticket.get("Data").get("needCaptchaCode", False):
-            captcha_image = dspac.request_captcha()
-            captcha_image.save("./DSPACcaptcha.png", format="PNG")
-            captcha_input = input(
-                "CAPTCHA image saved to ./DSPACcaptcha.png. Please open it and type in the code: "
-            )
-            dspac.request_email_code(captcha_input=captcha_input)
-            otp_code = input("Enter DSPAC security code: ")
-        else:
-            dspac.request_email_code()
-            otp_code = input("Enter DSPAC security code: ")
-        
-        login_ticket = await asyncio.to_thread(dspac.generate_login_ticket_email, otp_code)        
+        async with INTERACTIVE_LOGIN_LOCK:
+            if login_ticket.get("Data").get("needCaptchaCode", False):
+                captcha_image = await asyncio.to_thread(dspac.request_captcha)
+                captcha_image.save("./DSPACcaptcha.png", format="PNG")
+                captcha_input = await asyncio.to_thread(
+                    input,
+                    "CAPTCHA image saved to ./DSPACcaptcha.png. Please open it and type in the code: ",
+                )
+                await asyncio.to_thread(dspac.request_email_code, captcha_input=captcha_input)
+                otp_code = await asyncio.to_thread(input, "Enter DSPAC security code: ")
+            else:
+                await asyncio.to_thread(dspac.request_email_code)
+                otp_code = await asyncio.to_thread(input, "Enter DSPAC security code: ")
+
+            login_ticket = await asyncio.to_thread(dspac.generate_login_ticket_email, otp_code)
+            if login_ticket.get("Data") is None:
+                print("Invalid response from generating DSPAC login ticket with security code, skipping")
+                return None
     
     login_response = await asyncio.to_thread(dspac.login_with_ticket, login_ticket.get("Data").get("ticket"))
     if login_response.get("Outcome") != "Success":
-        raise Exception(f"Login failed. Response: {login_response}")
+        print(f"DSPAC login failed, skipping. Response: {login_response}")
+        return None
 
     account_info = await asyncio.to_thread(dspac.get_account_info)
+    if account_info.get("Data") is None:
+        print("Invalid response from retrieving DSPAC account info, skipping")
+        return None
     account_number = account_info.get("Data").get('accountNumber')
 
     if not account_number:
@@ -1,5 +1,7 @@
 import argparse
 import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from brokers import robinTrade, tradierTrade, tastyTrade, publicTrade, firstradeTrade, fennelTrade, schwabTrade, bbaeTrade, dspacTrade
 from setup import setup
 
@@ -20,6 +22,26 @@ async def main():
     if not all([args.quantity, args.ticker]):
         parser.error("Quantity and ticker are required for buy/sell actions")
 
+    # Reject bad order parameters once here instead of letting every broker fail on them
+    if args.quantity <= 0:
+        parser.error("Quantity must be a positive integer")
+    if args.price is not None and args.price <= 0:
+        parser.error("Price must be greater than zero")
+
+    # Brokers without credentials return before their first await; eager tasks let
+    # those finish inline instead of taking a trip through the event loop
+    loop = asyncio.get_running_loop()
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+
+    # The broker libraries are blocking and run through asyncio.to_thread; the stock
+    # default pool is min(32, cpu_count + 4) which queues logins and orders on small machines
+    thread_pool_size = os.getenv("BROKER_THREAD_POOL", "64")
+    if not thread_pool_size.isdigit() or int(thread_pool_size) <= 0:
+        parser.error(f"BROKER_THREAD_POOL must be a positive integer, got {thread_pool_size!r}")
+    thread_pool_size = int(thread_pool_size)
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=thread_pool_size, thread_name_prefix="broker"))
+
     async with asyncio.TaskGroup() as tg:
         tg.create_task(robinTrade(args.action, args.quantity, args.ticker, args.price)),
         tg.create_task(tradierTrade(args.action, args.quantity, args.ticker, args.price)),
@@ -33,4 +55,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional (it has no Windows support); fall back to the stock event loop
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())